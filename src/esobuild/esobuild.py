@@ -7,38 +7,115 @@ Generates random skill line combinations following the new subclassing system ru
 from __future__ import annotations
 
 import argparse
+import os
 import random
 import sys
 import termios
-import time
 import tty
-from typing import Any
+from contextlib import contextmanager
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from rich import box
 from rich.align import Align
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 from rich.text import Text
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+CONSOLE: Console = Console()
+_STDOUT_ISATTY: bool = sys.stdout.isatty()
+
 
 class QuitRequested(Exception):  # noqa: N818
     """Exception raised when user presses Q to quit."""
 
 
-# ESO Classes and their skill lines
-CLASSES = {
-    "Arcanist": ["Herald of the Tome", "Soldier of Apocrypha", "Curative Runeforms"],
-    "Dragonknight": ["Ardent Flame", "Draconic Power", "Earthen Heart"],
-    "Nightblade": ["Assassination", "Shadow", "Siphoning"],
-    "Sorcerer": ["Daedric Summoning", "Dark Magic", "Storm Calling"],
-    "Templar": ["Aedric Spear", "Dawn's Wrath", "Restoring Light"],
-    "Necromancer": ["Grave Lord", "Bone Tyrant", "Living Death"],
-    "Warden": ["Animal Companions", "Green Balance", "Winter's Embrace"],
+# ESO Classes and their skill lines (read-only, so the tuples can be shared without copying)
+CLASSES: MappingProxyType[str, tuple[str, ...]] = MappingProxyType({
+    "Arcanist": ("Herald of the Tome", "Soldier of Apocrypha", "Curative Runeforms"),
+    "Dragonknight": ("Ardent Flame", "Draconic Power", "Earthen Heart"),
+    "Nightblade": ("Assassination", "Shadow", "Siphoning"),
+    "Sorcerer": ("Daedric Summoning", "Dark Magic", "Storm Calling"),
+    "Templar": ("Aedric Spear", "Dawn's Wrath", "Restoring Light"),
+    "Necromancer": ("Grave Lord", "Bone Tyrant", "Living Death"),
+    "Warden": ("Animal Companions", "Green Balance", "Winter's Embrace"),
+})
+
+# Lookup tables derived from CLASSES once at import time
+CLASS_NAMES: tuple[str, ...] = tuple(CLASSES)
+SKILL_TO_CLASS: dict[str, str] = {skill: cls for cls, skills in CLASSES.items() for skill in skills}
+AVAILABLE_BY_CLASS: dict[str, tuple[str, ...]] = {
+    base: tuple(cls for cls in CLASS_NAMES if cls != base) for base in CLASS_NAMES
 }
 
 
+def _build_main_menu() -> Group:
+    """Build the static main menu screen."""
+    title = Text("ESO Build Randomizer", style="bold magenta")
+    subtitle = Text("Interactive Mode", style="dim cyan")
+
+    # Create menu options table
+    menu_table = Table(show_header=False, box=None, padding=(0, 2))
+    menu_table.add_column("Option", style="bold cyan", width=1)
+    menu_table.add_column("Description", style="white")
+
+    menu_table.add_row("1", "Generate random build (any class)")
+    menu_table.add_row("2", "Generate build for specific class")
+    menu_table.add_row("3", "Generate multiple builds")
+    menu_table.add_row("Q", "Quit")
+
+    return Group(
+        Align.center(title),
+        Align.center(subtitle),
+        Text(),
+        menu_table,
+        "\n[dim]Choose an option...[/dim]",
+    )
+
+
+def _build_class_menu() -> Group:
+    """Build the static class selection screen."""
+    class_table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
+    class_table.add_column("Option", style="bold cyan", width=4)
+    class_table.add_column("Class", style="white")
+
+    for i, cls in enumerate(CLASS_NAMES, 1):
+        class_table.add_row(str(i), cls)
+
+    class_table.add_row("Q", "Quit")
+
+    class_panel = Panel(
+        class_table,
+        title="[bold yellow]Choose Your Class[/bold yellow]",
+        border_style="yellow",
+        padding=(1, 2),
+    )
+    return Group(class_panel, "\n[dim]Choose a class or Q to quit...[/dim]")
+
+
+# Menu screens never change, so they are built once and reused on every redraw
+_MAIN_MENU = _build_main_menu()
+_CLASS_MENU = _build_class_menu()
+_BATCH_SETTINGS = Group(
+    Panel(
+        "[bold cyan]Multiple Build Generator[/bold cyan]\n\n"
+        + "Configure your batch generation settings:\n\n"
+        + "[dim]Press Q at any prompt to quit[/dim]",
+        title="[bold yellow]Batch Settings[/bold yellow]",
+        border_style="yellow",
+        padding=(1, 2),
+    ),
+    Text(),
+)
+
+
 def generate_random_build(
     base_class: str | None = None, num_lines: int | None = None
 ) -> dict[str, Any]:
@@ -59,10 +136,10 @@ def generate_random_build(
         ValueError: If num_lines is not 1 or 2.
     """
     if base_class is None:
-        base_class = random.choice(list(CLASSES.keys()))
+        base_class = random.choice(CLASS_NAMES)
 
-    original_skills = CLASSES[base_class].copy()
-    available_classes = [cls for cls in CLASSES if cls != base_class]
+    original_skills = CLASSES[base_class]
+    available_classes = AVAILABLE_BY_CLASS[base_class]
 
     # Decide how many skill lines to replace
     if num_lines is not None:
@@ -71,26 +148,17 @@ def generate_random_build(
             raise ValueError(msg)
         num_replacements = num_lines
     else:
-        num_replacements = random.choice([1, 2])
+        num_replacements = random.choice((1, 2))
 
-    # Select which original skills to replace
-    skills_to_replace = random.sample(original_skills, num_replacements)
-    remaining_original_skills = [
-        skill for skill in original_skills if skill not in skills_to_replace
-    ]
+    # Select which original skills to replace by position, keeping the rest in order
+    replace_positions = random.sample(range(len(original_skills)), num_replacements)
+    final_skills = [skill for i, skill in enumerate(original_skills) if i not in replace_positions]
 
     # Select replacement classes (must be different for each replacement)
-    replacement_classes = random.sample(available_classes, num_replacements)
-
-    # Build the final skill line combination
-    final_skills = remaining_original_skills.copy()
-    subclassed_from = []
+    subclassed_from = random.sample(available_classes, num_replacements)
 
-    for replacement_class in replacement_classes:
-        # Pick a random skill from the replacement class
-        replacement_skill = random.choice(CLASSES[replacement_class])
-        final_skills.append(replacement_skill)
-        subclassed_from.append(replacement_class)
+    # Pick a random skill from each replacement class
+    final_skills.extend(random.choice(CLASSES[cls]) for cls in subclassed_from)
 
     return {
         "base_class": base_class,
@@ -100,10 +168,8 @@ def generate_random_build(
     }
 
 
-def print_build(build: dict[str, Any]):
-    """Pretty print a build configuration using Rich for interactive mode."""
-    console = Console()
-
+def build_panel(build: dict[str, Any]) -> Panel:
+    """Create the Rich panel used to display a build in interactive mode."""
     # Create skill lines content
     skill_lines_content = []
     original_skills = CLASSES[build["base_class"]]
@@ -112,12 +178,7 @@ def print_build(build: dict[str, Any]):
         if skill in original_skills:
             skill_lines_content.append(f"   [cyan]• {skill}[/cyan]")
         else:
-            # Find which class this skill belongs to
-            source_class = None
-            for cls, skills in CLASSES.items():
-                if skill in skills:
-                    source_class = cls
-                    break
+            source_class = SKILL_TO_CLASS[skill]
             skill_lines_content.append(
                 f"   [cyan]• {skill}[/cyan] [yellow](from {source_class})[/yellow]"
             )
@@ -138,7 +199,7 @@ def print_build(build: dict[str, Any]):
     panel_content = "\n".join(panel_content_lines)
 
     # Create the panel with shorter title
-    panel = Panel(
+    return Panel(
         panel_content,
         border_style="bright_blue",
         padding=(1, 2),
@@ -146,30 +207,30 @@ def print_build(build: dict[str, Any]):
         title_align="center",
     )
 
-    console.print(panel)
 
+def print_build(build: dict[str, Any]):
+    """Pretty print a build configuration using Rich for interactive mode."""
+    CONSOLE.print(build_panel(build))
 
-def print_build_simple(build: dict[str, Any]):
-    """Simple, compact build output for command-line use."""
-    console = Console()
 
+def format_build_simple(build: dict[str, Any]) -> str:
+    """Format a build as compact markup for command-line use."""
     # Header with class name
-    console.print(f"\n[bold blue]{build['base_class']} Build[/bold blue]")
-    console.print("[blue]" + "─" * (len(build["base_class"]) + 6) + "[/blue]")
+    lines = [
+        f"\n[bold blue]{build['base_class']} Build[/bold blue]",
+        "[blue]" + "─" * (len(build["base_class"]) + 6) + "[/blue]",
+    ]
 
     # Skill lines
     original_skills = CLASSES[build["base_class"]]
     for skill in build["skill_lines"]:
         if skill in original_skills:
-            console.print(f"[cyan]• {skill}[/cyan]")
+            lines.append(f"[cyan]• {skill}[/cyan]")
         else:
-            # Find which class this skill belongs to
-            source_class = None
-            for cls, skills in CLASSES.items():
-                if skill in skills:
-                    source_class = cls
-                    break
-            console.print(f"[bold cyan]• {skill}[/bold cyan] [yellow]({source_class})[/yellow]")
+            source_class = SKILL_TO_CLASS[skill]
+            lines.append(f"[bold cyan]• {skill}[/bold cyan] [yellow]({source_class})[/yellow]")
+
+    return "\n".join(lines)
 
 
 def generate_multiple_builds(
@@ -178,29 +239,32 @@ def generate_multiple_builds(
     num_lines: int | None = None,
     simple_output: bool = False,
 ):
-    """Generate multiple random builds using Rich layout."""
-    console = Console()
+    """Generate multiple random builds using Rich layout.
 
-    if not simple_output:
-        # Header for interactive mode
-        header = Panel(
+    All builds are rendered up front and written with a single print call.
+    """
+    builds = [generate_random_build(base_class, num_lines) for _ in range(count)]
+
+    if simple_output:
+        if builds:
+            CONSOLE.print("\n".join(format_build_simple(build) for build in builds))
+        return
+
+    # Header for interactive mode
+    renderables: list[RenderableType] = [
+        Panel(
             Align.center(Text(f"{count} Random ESO Builds", style="bold magenta")),
             border_style="magenta",
             padding=(1, 2),
-        )
-        console.print(header)
-        console.print()
-
-    for i in range(count):
-        build = generate_random_build(base_class, num_lines)
-        if simple_output:
-            print_build_simple(build)
-        else:
-            print_build(build)
+        ),
+        Text(),
+    ]
+    for i, build in enumerate(builds):
+        if i:  # Blank line between builds, not after the last one
+            renderables.append(Text())
+        renderables.append(build_panel(build))
 
-        if i < count - 1:  # Don't print extra space after last build
-            if not simple_output:
-                console.print()
+    CONSOLE.print(Group(*renderables))
 
 
 def ask_for_retry(
@@ -211,31 +275,9 @@ def ask_for_retry(
     Raises:
         QuitRequested: If the user presses Q to quit.
     """
-    console = Console()
-
     if last_class:
-        console.print()
-
-        # Create options panel
-        options_text = []
-        if was_random:
-            options_text.append("[bold cyan]1.[/bold cyan] Generate another random build")
-        else:
-            options_text.append(f"[bold cyan]1.[/bold cyan] Generate another {last_class} build")
-        options_text.extend((
-            "[bold cyan]2.[/bold cyan] Start over (back to main menu)",
-            "[bold cyan]Q.[/bold cyan] Quit",
-        ))
-
-        options_panel = Panel(
-            "\n".join(options_text),
-            title="[bold blue]What's next?[/bold blue]",
-            border_style="blue",
-            padding=(1, 2),
-        )
-        console.print(options_panel)
-
-        console.print("\n[dim]Press 1, 2, or Q...[/dim]")
+        # Random builds all share one prompt, so don't key the cache on their class
+        CONSOLE.print(_get_retry_prompt(None if was_random else last_class, was_random))
         choice = get_single_key()
 
         if choice == "1":
@@ -245,11 +287,42 @@ def ask_for_retry(
         if choice == "q":
             raise QuitRequested
 
-        console.print("[yellow]Sorry, that's not a valid option. Please try again.[/yellow]")
+        CONSOLE.print("[yellow]Sorry, that's not a valid option. Please try again.[/yellow]")
         return False, None
     return False, None
 
 
+@cache
+def _get_retry_prompt(last_class: str | None, was_random: bool) -> Group:
+    """Get the retry options screen, built once per class or once for random builds."""
+    # Create options panel
+    options_text = []
+    if was_random:
+        options_text.append("[bold cyan]1.[/bold cyan] Generate another random build")
+    else:
+        options_text.append(f"[bold cyan]1.[/bold cyan] Generate another {last_class} build")
+    options_text.extend((
+        "[bold cyan]2.[/bold cyan] Start over (back to main menu)",
+        "[bold cyan]Q.[/bold cyan] Quit",
+    ))
+
+    options_panel = Panel(
+        "\n".join(options_text),
+        title="[bold blue]What's next?[/bold blue]",
+        border_style="blue",
+        padding=(1, 2),
+    )
+    return Group(Text(), options_panel, "\n[dim]Press 1, 2, or Q...[/dim]")
+
+
+@cache
+def _error_screen(message: str, padding: tuple[int, int] = (1, 2)) -> Group:
+    """Get a yellow error panel followed by a blank line, built once per message."""
+    return Group(
+        Panel(f"[yellow]{message}[/yellow]", border_style="yellow", padding=padding), Text()
+    )
+
+
 def handle_random_build():
     """Handle random build generation with retry logic."""
     clear_screen()
@@ -272,29 +345,10 @@ def handle_class_selection():
     Raises:
         QuitRequested: If the user presses Q to quit.
     """
-    console = Console()
     clear_screen()
 
     while True:
-        # Create class selection panel
-        class_table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
-        class_table.add_column("Option", style="bold cyan", width=4)
-        class_table.add_column("Class", style="white")
-
-        for i, cls in enumerate(CLASSES.keys(), 1):
-            class_table.add_row(str(i), cls)
-
-        class_table.add_row("Q", "Quit")
-
-        class_panel = Panel(
-            class_table,
-            title="[bold yellow]Choose Your Class[/bold yellow]",
-            border_style="yellow",
-            padding=(1, 2),
-        )
-
-        console.print(class_panel)
-        console.print("\n[dim]Choose a class or Q to quit...[/dim]")
+        CONSOLE.print(_CLASS_MENU)
 
         class_choice = get_single_key()
         try:
@@ -302,7 +356,7 @@ def handle_class_selection():
                 raise QuitRequested
             class_index = int(class_choice) - 1
             if 0 <= class_index < len(CLASSES):
-                selected_class = list(CLASSES.keys())[class_index]
+                selected_class = CLASS_NAMES[class_index]
                 clear_screen()
                 build = generate_random_build(selected_class)
                 print_build(build)
@@ -316,22 +370,12 @@ def handle_class_selection():
                     retry, retry_class = ask_for_retry(retry_class, was_random=False)
                 break
             # Don't clear screen - show error with context
-            error_panel = Panel(
-                "[yellow]Sorry, that's not a valid class number. Please try again![/yellow]",
-                border_style="yellow",
-                padding=(1, 2),
+            CONSOLE.print(
+                _error_screen("Sorry, that's not a valid class number. Please try again!")
             )
-            console.print(error_panel)
-            console.print()
         except ValueError:
             # Don't clear screen - show error with context
-            error_panel = Panel(
-                "[yellow]Please enter a number for the class selection.[/yellow]",
-                border_style="yellow",
-                padding=(1, 2),
-            )
-            console.print(error_panel)
-            console.print()
+            CONSOLE.print(_error_screen("Please enter a number for the class selection."))
 
 
 def handle_multiple_builds():
@@ -340,21 +384,10 @@ def handle_multiple_builds():
     Raises:
         QuitRequested: If the user presses Q to quit.
     """
-    console = Console()
     clear_screen()
 
     while True:
-        # Create input panel
-        input_panel = Panel(
-            "[bold cyan]Multiple Build Generator[/bold cyan]\n\n"
-            + "Configure your batch generation settings:\n\n"
-            + "[dim]Press Q at any prompt to quit[/dim]",
-            title="[bold yellow]Batch Settings[/bold yellow]",
-            border_style="yellow",
-            padding=(1, 2),
-        )
-        console.print(input_panel)
-        console.print()
+        CONSOLE.print(_BATCH_SETTINGS)
 
         try:
             count = Prompt.ask("[cyan]How many builds to generate?[/cyan]", default="5")
@@ -371,18 +404,12 @@ def handle_multiple_builds():
 
             clear_screen()
             generate_multiple_builds(count, num_lines=lines)
-            console.print("\n[dim]Press any key to continue...[/dim]")
+            CONSOLE.print("\n[dim]Press any key to continue...[/dim]")
             get_single_key()
             break
         except ValueError:
             # Don't clear screen - show error with context
-            error_panel = Panel(
-                "[yellow]Please enter a valid number.[/yellow]",
-                border_style="yellow",
-                padding=(1, 2),
-            )
-            console.print(error_panel)
-            console.print()
+            CONSOLE.print(_error_screen("Please enter a valid number."))
 
 
 def interactive_mode() -> None:
@@ -391,31 +418,11 @@ def interactive_mode() -> None:
     Raises:
         QuitRequested: If user presses Q at any point.
     """
-    console = Console()
     clear_screen()
 
     while True:
         try:
-            # Create the main menu
-            title = Text("ESO Build Randomizer", style="bold magenta")
-            subtitle = Text("Interactive Mode", style="dim cyan")
-
-            # Create menu options table
-            menu_table = Table(show_header=False, box=None, padding=(0, 2))
-            menu_table.add_column("Option", style="bold cyan", width=1)
-            menu_table.add_column("Description", style="white")
-
-            menu_table.add_row("1", "Generate random build (any class)")
-            menu_table.add_row("2", "Generate build for specific class")
-            menu_table.add_row("3", "Generate multiple builds")
-            menu_table.add_row("Q", "Quit")
-
-            # Display the menu
-            console.print(Align.center(title))
-            console.print(Align.center(subtitle))
-            console.print()
-            console.print(menu_table)
-            console.print("\n[dim]Choose an option...[/dim]")
+            CONSOLE.print(_MAIN_MENU)
 
             choice = get_single_key()
 
@@ -429,32 +436,30 @@ def interactive_mode() -> None:
                 raise QuitRequested
             else:
                 # Don't clear screen - show error with context
-                error_panel = Panel(
-                    "[yellow]Sorry, that's not a valid option. Try 1, 2, 3, or Q.[/yellow]",
-                    border_style="yellow",
-                    padding=(0, 2),
+                CONSOLE.print(
+                    _error_screen(
+                        "Sorry, that's not a valid option. Try 1, 2, 3, or Q.", padding=(0, 2)
+                    )
                 )
-                console.print(error_panel)
-                console.print()
         except QuitRequested:
             clear_screen()
             break
         except Exception as e:
-            console = Console()
-            console.print(f"[red]An error occurred: {e}[/red]")
-            console.print("\n[dim]Press any key to continue...[/dim]")
+            CONSOLE.print(
+                f"[red]An error occurred: {e}[/red]\n\n[dim]Press any key to continue...[/dim]"
+            )
             get_single_key()
             clear_screen()
 
 
 def clear_screen():
     """Clear the terminal screen and position cursor at top-left."""
-    console = Console()
-    console.clear()
-    # Add a small delay to ensure the clear operation completes
-    time.sleep(0.05)
-    # Force flush to ensure immediate clearing
-    sys.stdout.flush()
+    if _STDOUT_ISATTY:
+        # Clear screen and home the cursor in a single write
+        sys.stdout.write("\x1b[2J\x1b[H")
+        sys.stdout.flush()
+        return
+    CONSOLE.clear()
 
 
 def get_single_key() -> str:
@@ -466,25 +471,21 @@ def get_single_key() -> str:
     """
     try:
         # Try Unix-style terminal input first
-        if hasattr(sys.stdin, "fileno") and sys.stdout.isatty():
+        if hasattr(sys.stdin, "fileno") and _STDOUT_ISATTY:
             fd = sys.stdin.fileno()
-            old_settings = termios.tcgetattr(fd)
-            try:
-                tty.setraw(sys.stdin.fileno())
-                key = sys.stdin.read(1)
-                if key == "\x03":  # Ctrl+C
-                    raise KeyboardInterrupt
-                if key.lower() == "q":
-                    raise QuitRequested
-                return key.lower()
-            finally:
-                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        else:
-            # Fallback when not in a proper terminal
-            key = Prompt.ask("Press a key", default="").strip().lower()
-            if key == "q":
-                raise QuitRequested from None
-            return key
+            with _raw_mode(fd):
+                # Read straight from the fd to skip sys.stdin's buffering and decoding
+                key = os.read(fd, 1).decode("latin-1")
+            if key == "\x03":  # Ctrl+C
+                raise KeyboardInterrupt
+            if key.lower() == "q":
+                raise QuitRequested
+            return key.lower()
+        # Fallback when not in a proper terminal
+        key = Prompt.ask("Press a key", default="").strip().lower()
+        if key == "q":
+            raise QuitRequested from None
+        return key
     except (ImportError, AttributeError, OSError):
         # Fallback for systems without termios or when not in a proper terminal
         key = Prompt.ask("Press a key", default="").strip().lower()
@@ -493,6 +494,17 @@ def get_single_key() -> str:
         return key
 
 
+@contextmanager
+def _raw_mode(fd: int) -> Iterator[None]:
+    """Put the terminal into raw mode, restoring its previous settings on exit."""
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setraw(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
 def main():
     """Main entry point for the script."""
     parser = argparse.ArgumentParser(description="ESO Build Randomizer")
@@ -503,7 +515,7 @@ def main():
         "-c",
         "--class",
         dest="base_class",
-        choices=list(CLASSES.keys()),
+        choices=CLASS_NAMES,
         help="Generate builds for specific class only",
     )
     parser.add_argument(
@@ -520,27 +532,24 @@ def main():
         if args.interactive:
             interactive_mode()
         else:
-            console = Console()
-            console.print("\n[bold magenta]ESO Build Randomizer[/bold magenta]")
-            console.print("[magenta]" + "─" * len("ESO Build Randomizer") + "[/magenta]")
+            CONSOLE.print("\n[bold magenta]ESO Build Randomizer[/bold magenta]")
+            CONSOLE.print("[magenta]" + "─" * len("ESO Build Randomizer") + "[/magenta]")
 
             if args.lines and not 1 <= args.lines <= 2:
-                console.print("[yellow]Number of lines to replace should be 1 or 2.[/yellow]")
+                CONSOLE.print("[yellow]Number of lines to replace should be 1 or 2.[/yellow]")
                 return
 
             generate_multiple_builds(args.number, args.base_class, args.lines, simple_output=True)
 
-            console.print(
+            CONSOLE.print(
                 "\n[dim]Tip: Use --help to see all options, or -i for interactive mode![/dim]"
             )
     except QuitRequested:
         clear_screen()
     except KeyboardInterrupt:
-        console = Console()
-        console.print("\n[cyan]Goodbye![/cyan]")
+        CONSOLE.print("\n[cyan]Goodbye![/cyan]")
     except Exception as e:
-        console = Console()
-        console.print(f"[red]An error occurred: {e}[/red]")
+        CONSOLE.print(f"[red]An error occurred: {e}[/red]")
 
 
 if __name__ == "__main__":